@@ -32,8 +32,9 @@ class StoreMapping(argparse._StoreAction):
     def __init__(self, *args, choices, **kwargs):
         super().__init__(*args, choices=choices.keys(), **kwargs)
         self.mapping = choices
+        self._get = choices.__getitem__
     def __call__(self, parser, namespace, value, option_string=None):
-        setattr(namespace, self.dest, self.mapping[value])
+        setattr(namespace, self.dest, self._get(value))
 
 class AppendMapping(StoreMapping):
     """
@@ -43,14 +44,25 @@ class AppendMapping(StoreMapping):
     AppendMapping(option_strings=['--foo'], dest='foo', ...)
     >>> parser.parse_args('--foo rock --foo scissors'.split())
     Namespace(foo=[4, 8])
+
+    Neither a default nor a list from an earlier parse is modified.
+    >>> default = [0]
+    >>> parser = argparse.ArgumentParser()
+    >>> parser.add_argument('--foo', action=AppendMapping, choices=adict, default=default)  # doctest: +ELLIPSIS
+    AppendMapping(option_strings=['--foo'], dest='foo', ...)
+    >>> ns = parser.parse_args('--foo rock'.split())
+    >>> parser.parse_args('--foo paper'.split(), namespace=argparse.Namespace(foo=ns.foo))
+    Namespace(foo=[0, 4, 5])
+    >>> ns, default
+    (Namespace(foo=[0, 4]), [0])
     """
     def __call__(self, parser, namespace, value, option_string=None):
         items = getattr(namespace, self.dest, None)
         items = argparse._copy_items(items)
-        items.append(self.mapping[value])
+        items.append(self._get(value))
         setattr(namespace, self.dest, items)
 
-class ExtendMapping(StoreMapping):
+class ExtendMapping(AppendMapping):
     """
     >>> adict = {'rock': 4, 'paper': 5, 'scissors': 8}
     >>> parser = argparse.ArgumentParser()
@@ -58,11 +70,16 @@ class ExtendMapping(StoreMapping):
     ExtendMapping(option_strings=['--foo'], dest='foo', nargs='+', ...)
     >>> parser.parse_args(["--foo", "rock", "--foo", "paper", "scissors", "rock"])
     Namespace(foo=[4, 5, 8, 4])
+    >>> ns = parser.parse_args(["--foo", "rock"])
+    >>> parser.parse_args(["--foo", "paper"], namespace=argparse.Namespace(foo=ns.foo))
+    Namespace(foo=[4, 5])
+    >>> ns
+    Namespace(foo=[4])
     """
     def __call__(self, parser, namespace, values, option_string=None):
         items = getattr(namespace, self.dest, None)
         items = argparse._copy_items(items)
-        items.extend(self.mapping[value] for value in values)
+        items.extend(map(self._get, values))
         setattr(namespace, self.dest, items)
 
 if __name__ == '__main__':
@@ -2,6 +2,8 @@
 
 """How to use this...
 
+>>> import csv
+
 # Use "exit_on_error=False" to make doctest happier.
 >>> parser = argparse.ArgumentParser(exit_on_error=False)
 
@@ -24,6 +26,53 @@ TypeError: quotechar must be set if quoting enabled
 >>> argparser_dialect = csv_group.get_dialect(ns)
 >>> csvout = csv.writer(sys.stdout, dialect=argparser_dialect)
 
+# Dialects are cached, so the same settings give back the same class.
+>>> parser = argparse.ArgumentParser()
+>>> csv_group = parser.add_csv_group()
+>>> default_dialect = csv_group.get_dialect(parser.parse_args([]))
+>>> csv_group.get_dialect(parser.parse_args([])) is default_dialect
+True
+>>> ns = parser.parse_args('--delimiter ;'.split())
+>>> csv_group.get_dialect(ns) is csv_group.get_dialect(ns)
+True
+>>> csv_group.get_dialect(ns) is default_dialect
+False
+>>> csv_group.get_dialect(ns).delimiter
+';'
+
+# Giving an option its default value doesn't change the Dialect.
+>>> ns = parser.parse_args(['--lineterminator', os.linesep])
+>>> csv_group.get_dialect(ns) is default_dialect
+True
+
+# A prefix keeps several groups apart on one parser.
+>>> parser = argparse.ArgumentParser()
+>>> in_group = parser.add_csv_group(prefix='in')
+>>> out_group = parser.add_csv_group(prefix='out')
+>>> ns = parser.parse_args('--in-delimiter ; --out-delimiter |'.split())
+>>> in_group.get_dialect(ns).__name__
+'in_argparse_csv'
+>>> in_group.get_dialect(ns).delimiter, out_group.get_dialect(ns).delimiter
+(';', '|')
+
+# Each group has its own classes, even when the prefixes match.
+>>> other_parser = argparse.ArgumentParser()
+>>> other_group = other_parser.add_csv_group(prefix='in')
+>>> other_ns = other_parser.parse_args('--in-delimiter ;'.split())
+>>> other_group.get_dialect(other_ns) is in_group.get_dialect(ns)
+False
+
+# Other keyword arguments are passed along to 'add_argument_group'.
+>>> parser = argparse.ArgumentParser()
+>>> action = parser.add_argument('--delimiter')
+>>> csv_group = parser.add_csv_group(conflict_handler='resolve')
+>>> csv_group.get_dialect(parser.parse_args('--delimiter ;'.split())).delimiter
+';'
+>>> parser.add_csv_group(prefx='out')  # doctest: +ELLIPSIS
+Traceback (most recent call last):
+    ...
+TypeError: ...unexpected keyword argument 'prefx'
+
 """
 
 # Insure maximum compatibility between Python 2 and 3
@@ -39,23 +88,46 @@ __version__ = '0.9'
 __all__ = []
 
 # Python standard libraries
-import argparse, csv, os, sys
+import argparse, os, sys
+from collections.abc import Mapping
+from functools import lru_cache
 
 from argparse_actions import StoreMapping
 
 def singlechar(s):
     """Validate that 's' is a single character."""
-    try:
-        if len(s) == 1:
-            return s
-    except:
-        pass
+    if isinstance(s, str) and len(s) == 1:
+        return s
     raise ValueError('must be a single character')
 
-quoting_choices = {
-    name[6:].lower(): getattr(csv, name)
-    for name in dir(csv) if name.startswith('QUOTE_')
-    }
+_quoting_names = (
+    'QUOTE_MINIMAL', 'QUOTE_ALL', 'QUOTE_NONE', 'QUOTE_NONNUMERIC',
+    )
+# QUOTE_STRINGS and QUOTE_NOTNULL were added in Python 3.12.
+if sys.version_info >= (3, 12):
+    _quoting_names += ('QUOTE_STRINGS', 'QUOTE_NOTNULL')
+
+@lru_cache(maxsize=None)
+def _quoting_choices():
+    """Map the '--quoting' choices to csv.QUOTE_* values."""
+    import csv
+    return {
+        name[6:].lower(): getattr(csv, name)
+        for name in _quoting_names
+        }
+
+class _LazyChoices(Mapping):
+    """A read-only view of _quoting_choices() that defers importing
+    the csv module until a choice is actually looked up.  Listing the
+    choices (for usage and help text) doesn't need the csv module."""
+    def __getitem__(self, key):
+        return _quoting_choices()[key]
+    def __iter__(self):
+        return (name[6:].lower() for name in _quoting_names)
+    def __len__(self):
+        return len(_quoting_names)
+
+quoting_choices = _LazyChoices()
 
 try:
     is_bool = {'action': argparse.BooleanOptionalAction}
@@ -74,37 +146,87 @@ dialect_attributes = (
     ('quoting', {'action': StoreMapping, 'choices': quoting_choices}),
     )
 
-def add_csv_group(container, *args, **kwargs):
-    """Add an argument group to the given parser, using the given title
-    and description.  The returned group has a property 'get_dialect'
-    that's a function to create a CSV Dialect object from a Namespace
-    object built from parsing a command line."""
-
-    group = container.add_argument_group(
-        title=kwargs.get('title'),
-        description=kwargs.get('description'))
+# Values that every generated Dialect starts out with.
+_dialect_defaults = {
+    key: kwds['default']
+    for key, kwds in dialect_attributes if 'default' in kwds
+    }
 
-    prefix = kwargs.get('prefix')
+def _base_dialect(class_name):
+    """Build the Dialect used when nothing overrides the defaults."""
+    import csv
+    class_defs = dict(_dialect_defaults, _name=class_name)
+    return type(class_name, (csv.Dialect,), class_defs)
+
+@lru_cache(maxsize=16)
+def _compiled(prefix):
+    """Return the Dialect class name for the given prefix, along with
+    (name, option string, Namespace attribute, add_argument keywords)
+    for each dialect attribute."""
     if prefix:
         arg_prefix = '--' + prefix + '-'
         attr_prefix = prefix + '_'
     else:
         arg_prefix = '--'
         attr_prefix = ''
+    return attr_prefix + "argparse_csv", tuple(
+        (name, arg_prefix + name, sys.intern(attr_prefix + name), kwds)
+        for name, kwds in dialect_attributes)
+
+def add_csv_group(container, *args, **kwargs):
+    """Add an argument group to the given parser, using the given title
+    and description.  The returned group has a property 'get_dialect'
+    that's a function to create a CSV Dialect object from a Namespace
+    object built from parsing a command line.  Namespaces with equal
+    settings get the same Dialect class back, so treat the classes as
+    read-only; to change one, subclass it.  One class is kept for each
+    distinct combination of settings seen, for as long as the group
+    exists.  Any other keyword arguments are passed along to
+    'add_argument_group', so a misspelt or unknown keyword raises
+    TypeError instead of being ignored."""
+
+    title = kwargs.pop('title', None)
+    description = kwargs.pop('description', None)
+    prefix = kwargs.pop('prefix', None)
+
+    group = container.add_argument_group(
+        title=title, description=description, **kwargs)
+
+    class_name, compiled = _compiled(prefix)
+
+    for _, arg_name, _, kwds in compiled:
+        group.add_argument(arg_name, **kwds)
+
+    _resolved = [(name, attr_name) for name, _, attr_name, _ in compiled]
 
-    for name, kwds in dialect_attributes:
-        group.add_argument(arg_prefix+name, **kwds)
+    # Namespaces with identical settings share a single Dialect class;
+    # those that override nothing get this group's base class.  The
+    # base is built on first use so that merely adding the group (e.g.
+    # for '--help') doesn't import csv.  The cache is unbounded; it
+    # grows by one entry per distinct combination of settings.
+    _cache = {}
+    base = None
 
     def get_dialect(ns):
         """Build a CSV Dialect from an argparse Namespace"""
-        class_name = attr_prefix + "argparse_csv"
-        class_defs = {'_name': class_name}
-        for key, _ in dialect_attributes:
-            attr_name = attr_prefix + key
-            attr_value = getattr(ns, attr_name)
-            if attr_value is not None:
-                class_defs[key] = attr_value
-        return type(class_name, (csv.Dialect,), class_defs)
+        nonlocal base
+        key = tuple((k, getattr(ns, attr_name)) for k, attr_name in _resolved)
+        cls = _cache.get(key)
+        if cls is None:
+            if base is None:
+                base = _base_dialect(class_name)
+            class_defs = {}
+            for attr_key, attr_value in key:
+                if (attr_value is not None and
+                        attr_value != _dialect_defaults.get(attr_key)):
+                    class_defs[attr_key] = attr_value
+            if class_defs:
+                class_defs['_name'] = class_name
+                cls = type(class_name, (base,), class_defs)
+            else:
+                cls = base
+            _cache[key] = cls
+        return cls
 
     group.get_dialect = get_dialect
     return group